@@ -1,49 +1,70 @@
 """
 Tests for the Mergington High School API endpoints
 """
+import copy
+
 import pytest
+from fastapi.responses import RedirectResponse
 from fastapi.testclient import TestClient
 from src.app import app, activities
 
 
-@pytest.fixture
+# Canonical activity state restored before each test
+_INITIAL_ACTIVITIES = {
+    "Soccer Team": {
+        "description": "Join the school soccer team and compete in inter-school matches",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
+        "max_participants": 25,
+        "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
+    },
+    "Basketball Club": {
+        "description": "Practice basketball skills and play in tournaments",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 20,
+        "participants": ["david@mergington.edu", "emily@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Participate in theater productions and improve acting skills",
+        "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": ["james@mergington.edu", "lisa@mergington.edu"]
+    },
+}
+
+ACTIVITY_NAMES = tuple(_INITIAL_ACTIVITIES)
+
+SIGNUP_URL = "/activities/{activity}/signup?email={email}"
+UNREGISTER_URL = "/activities/{activity}/unregister?email={email}"
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a single test client for the FastAPI app, shared by every test class
+
+    Entering the client as a context manager keeps one anyio portal open for
+    the whole module, so requests reuse it instead of starting a new one per call.
+    """
+    with TestClient(app) as c:
+        yield c
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_activities():
-    """Reset activities to initial state before each test"""
+    """Reset activities to initial state before each state-mutating test"""
     activities.clear()
-    activities.update({
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in inter-school matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and play in tournaments",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["david@mergington.edu", "emily@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Participate in theater productions and improve acting skills",
-            "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["james@mergington.edu", "lisa@mergington.edu"]
-        },
-    })
+    activities.update(copy.deepcopy(_INITIAL_ACTIVITIES))
 
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
     
-    def test_root_redirects_to_index(self, client):
+    def test_root_redirects_to_index(self):
         """Test that root redirects to static index.html"""
-        response = client.get("/", follow_redirects=False)
+        route = next(r for r in app.routes if getattr(r, "path", None) == "/")
+        assert "GET" in route.methods
+        
+        response = route.endpoint()
+        assert isinstance(response, RedirectResponse)
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -74,25 +95,32 @@ class TestGetActivities:
         assert isinstance(soccer_team["participants"], list)
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_new_participant(self, client):
-        """Test signing up a new participant for an activity"""
-        response = client.post(
-            "/activities/Soccer Team/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 200
+    @pytest.mark.parametrize("path, status", [
+        ("/activities/Soccer Team/signup?email=newstudent@mergington.edu", 200),
+        ("/activities/Soccer%20Team/signup?email=another@mergington.edu", 200),
+        ("/activities/NonExistent Activity/signup?email=student@mergington.edu", 404),
+    ], ids=["new_participant", "url_encoded_activity_name", "nonexistent_activity"])
+    def test_signup(self, client, path, status):
+        """Test signing up for an activity, including URL-encoded and unknown names"""
+        response = client.post(path)
+        assert response.status_code == status
         data = response.json()
         
+        if status == 404:
+            assert "not found" in data["detail"].lower()
+            return
+        
+        email = path.split("email=")[1]
         assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
+        assert email in data["message"]
         assert "Soccer Team" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Soccer Team"]["participants"]
+        assert email in activities["Soccer Team"]["participants"]
     
     def test_signup_duplicate_participant(self, client):
         """Test that signing up an already registered participant fails"""
@@ -102,49 +130,34 @@ class TestSignupForActivity:
         assert response.status_code == 400
         data = response.json()
         assert "already signed up" in data["detail"].lower()
-    
-    def test_signup_nonexistent_activity(self, client):
-        """Test that signing up for a non-existent activity fails"""
-        response = client.post(
-            "/activities/NonExistent Activity/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
-    def test_signup_url_encoded_activity_name(self, client):
-        """Test signing up with URL-encoded activity name"""
-        response = client.post(
-            "/activities/Soccer%20Team/signup?email=another@mergington.edu"
-        )
-        assert response.status_code == 200
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_existing_participant(self, client):
-        """Test unregistering an existing participant from an activity"""
-        # First verify the participant exists
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "alex@mergington.edu" in activities_data["Soccer Team"]["participants"]
-        
-        # Unregister the participant
-        response = client.delete(
-            "/activities/Soccer Team/unregister?email=alex@mergington.edu"
-        )
-        assert response.status_code == 200
+    @pytest.mark.parametrize("path, status", [
+        ("/activities/Soccer Team/unregister?email=alex@mergington.edu", 200),
+        ("/activities/Soccer%20Team/unregister?email=alex@mergington.edu", 200),
+        ("/activities/NonExistent Activity/unregister?email=student@mergington.edu", 404),
+    ], ids=["existing_participant", "url_encoded_activity_name", "nonexistent_activity"])
+    def test_unregister(self, client, path, status):
+        """Test unregistering from an activity, including URL-encoded and unknown names"""
+        response = client.delete(path)
+        assert response.status_code == status
         data = response.json()
         
+        if status == 404:
+            assert "not found" in data["detail"].lower()
+            return
+        
+        email = path.split("email=")[1]
         assert "message" in data
-        assert "alex@mergington.edu" in data["message"]
+        assert email in data["message"]
         assert "Soccer Team" in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "alex@mergington.edu" not in activities_data["Soccer Team"]["participants"]
+        assert email not in activities["Soccer Team"]["participants"]
     
     def test_unregister_non_registered_participant(self, client):
         """Test that unregistering a non-registered participant fails"""
@@ -154,24 +167,9 @@ class TestUnregisterFromActivity:
         assert response.status_code == 400
         data = response.json()
         assert "not signed up" in data["detail"].lower()
-    
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test that unregistering from a non-existent activity fails"""
-        response = client.delete(
-            "/activities/NonExistent Activity/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
-    def test_unregister_url_encoded_activity_name(self, client):
-        """Test unregistering with URL-encoded activity name"""
-        response = client.delete(
-            "/activities/Soccer%20Team/unregister?email=alex@mergington.edu"
-        )
-        assert response.status_code == 200
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestIntegrationScenarios:
     """Integration tests for combined operations"""
     
@@ -179,49 +177,39 @@ class TestIntegrationScenarios:
         """Test the complete flow of signing up and then unregistering"""
         email = "testflow@mergington.edu"
         activity = "Basketball Club"
+        signup_url = SIGNUP_URL.format(activity=activity, email=email)
+        unregister_url = UNREGISTER_URL.format(activity=activity, email=email)
         
         # Get initial participant count
-        response = client.get("/activities")
-        initial_count = len(response.json()[activity]["participants"])
+        initial_count = len(activities[activity]["participants"])
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        signup_response = client.post(signup_url)
         assert signup_response.status_code == 200
         
         # Verify participant was added
-        response = client.get("/activities")
-        assert email in response.json()[activity]["participants"]
-        assert len(response.json()[activity]["participants"]) == initial_count + 1
+        participants = activities[activity]["participants"]
+        assert email in participants
+        assert len(participants) == initial_count + 1
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        unregister_response = client.delete(unregister_url)
         assert unregister_response.status_code == 200
         
         # Verify participant was removed
-        response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
-        assert len(response.json()[activity]["participants"]) == initial_count
+        participants = activities[activity]["participants"]
+        assert email not in participants
+        assert len(participants) == initial_count
     
     def test_multiple_activities_signup(self, client):
         """Test signing up for multiple activities"""
         email = "multisport@mergington.edu"
         
-        # Sign up for Soccer Team
-        response1 = client.post(f"/activities/Soccer Team/signup?email={email}")
-        assert response1.status_code == 200
-        
-        # Sign up for Basketball Club
-        response2 = client.post(f"/activities/Basketball Club/signup?email={email}")
-        assert response2.status_code == 200
-        
-        # Sign up for Drama Club
-        response3 = client.post(f"/activities/Drama Club/signup?email={email}")
-        assert response3.status_code == 200
-        
-        # Verify participant is in all three activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
+        # Sign up for every activity
+        for activity in ACTIVITY_NAMES:
+            response = client.post(SIGNUP_URL.format(activity=activity, email=email))
+            assert response.status_code == 200
         
-        assert email in activities_data["Soccer Team"]["participants"]
-        assert email in activities_data["Basketball Club"]["participants"]
-        assert email in activities_data["Drama Club"]["participants"]
+        # Verify participant is in every activity
+        for activity in ACTIVITY_NAMES:
+            assert email in activities[activity]["participants"]